@@ -6,6 +6,8 @@ import random
 # Импорты aiogram
 from aiogram import Bot, Dispatcher, types, F
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
 from aiogram.filters import Command
 from aiogram.types import InlineKeyboardButton
 from aiogram.utils.keyboard import InlineKeyboardBuilder
@@ -14,14 +16,14 @@ from aiogram.utils.keyboard import InlineKeyboardBuilder
 from utils.recipe_synthesizer import (
     KNOWLEDGE_BASE,
     load_knowledge_base,
-    synthesize_response,
-    find_random_recipe_by_category,
-    get_all_cuisines,
     find_random_recipe_by_cuisine,
     assemble_recipe,
-    find_recipe_by_intention,
-    find_recipe_by_id
+    find_recipe_by_id,
+    resolve_free_text_query
 )
+from utils.knowledge_records import Recipe
+from utils.callback_codec import CATALOGUE, encode_callback, decode_callback, register_categories
+from utils.synthesis_executor import SynthesisExecutor, SynthesisOverloaded
 
 # --- БЛОК НАСТРОЙКИ ---
 
@@ -44,9 +46,16 @@ TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN_V2")
 if not TELEGRAM_TOKEN:
     raise ValueError("Не найден токен TELEGRAM_TOKEN_V2 в .env файле!")
 
-bot = Bot(token=TELEGRAM_TOKEN, default=DefaultBotProperties(parse_mode="HTML"))
+# Альтернативный адрес Bot API (например, фейковый сервер из loadtest/). Пусто — настоящий Telegram.
+TELEGRAM_API_SERVER = os.getenv("TELEGRAM_API_SERVER")
+bot_session = AiohttpSession(api=TelegramAPIServer.from_base(TELEGRAM_API_SERVER)) if TELEGRAM_API_SERVER else None
+
+bot = Bot(token=TELEGRAM_TOKEN, session=bot_session, default=DefaultBotProperties(parse_mode="HTML"))
 dp = Dispatcher()
 
+# ИСПОЛНИТЕЛЬ СИНТЕЗАТОРА (режим, воркеры, очередь и таймаут — из SYNTHESIS_* в .env)
+SYNTHESIS_EXECUTOR = SynthesisExecutor.from_env()
+
 # ХРАНИЛИЩЕ СЕССИЙ
 USER_SESSIONS = {}
 
@@ -62,6 +71,20 @@ CATEGORY_ALIASES = {
     "veg_preserves": ["консервация", "соленья", "маринование", "заготовки"]
 }
 
+# КНОПКИ КАТЕГОРИЙ В ГЛАВНОМ МЕНЮ
+MAIN_MENU_CATEGORIES = [
+    ("🔥 Горячее", "hot_dishes"), ("🥣 Супы", "soups"), ("🍝 Паста", "pasta"),
+    ("🥗 Салаты", "salads"), ("🥔 Гарниры", "garnishes"), ("🍳 Завтраки", "breakfasts"),
+    ("🥪 Бутерброды", "sandwiches"), ("✨ Жареное Золото", "fried_gold"), ("🥧 Выпечка", "baked_goods"),
+    ("🍰 Десерты", "desserts"), ("🌶️ Соусы", "sauces"), ("🍸 Напитки", "drinks"),
+    ("🥩 Вяление/Посол", "meats_curing"), ("🥒 Консервация", "veg_preserves")
+]
+
+# Категории меню и алиасов получают callback-коды, даже если рецептов в них пока нет:
+# иначе главное меню не соберется, а ветка «пока пусто» станет недостижимой.
+register_categories([category_key for _, category_key in MAIN_MENU_CATEGORIES])
+register_categories(CATEGORY_ALIASES)
+
 # СЛОВАРЬ ДЛЯ НАЗВАНИЙ КУХОНЬ
 CUISINE_NAMES = {
     "american": "🇺🇸 Американская", "american_fusion": "🇺🇸 Фьюжн (США)", "american_italian": "🇺🇸🇮🇹 Итало-американская",
@@ -82,6 +105,14 @@ CUISINE_NAMES = {
     "swedish": "🇸🇪 Шведская", "tatar": " Tatar", "tex-mex": "🇺🇸/🇲🇽 Tex-Mex", "thai": "🇹🇭 Тайская"
 }
 
+# КЛАВИАТУРА РЕЦЕПТА: термины, связанные рецепты и навигация одним сообщением
+COMBINED_RECIPE_KEYBOARD = os.getenv("COMBINED_RECIPE_KEYBOARD", "1") == "1"
+TELEGRAM_MAX_KEYBOARD_BUTTONS = 100
+RECIPE_KEYBOARD_SINGLE_COLUMN_MAX = 10
+
+# МЕНЮ КУХОНЬ: по сколько кухонь показывать на одной странице
+CUISINES_PER_PAGE = 12
+
 # Словарь для контекстных реакций на категории
 CATEGORY_REACTIONS = {
     "hot_dishes": "Только не съешь все сразу. Особенно на ночь."
@@ -98,34 +129,79 @@ def get_user_session(user_id: int) -> dict:
     session.setdefault("seen_recipes_cuisine", {})
     session.setdefault("total_clicks", 0)
     session.setdefault("last_menu", "main")
+    session.setdefault("cuisine_page", 0)
     return session
 
 def get_main_menu_builder() -> InlineKeyboardBuilder:
     builder = InlineKeyboardBuilder()
-    categories = [
-        ("🔥 Горячее", "hot_dishes"), ("🥣 Супы", "soups"), ("🍝 Паста", "pasta"),
-        ("🥗 Салаты", "salads"), ("🥔 Гарниры", "garnishes"), ("🍳 Завтраки", "breakfasts"),
-        ("🥪 Бутерброды", "sandwiches"), ("✨ Жареное Золото", "fried_gold"), ("🥧 Выпечка", "baked_goods"),
-        ("🍰 Десерты", "desserts"), ("🌶️ Соусы", "sauces"), ("🍸 Напитки", "drinks"),
-        ("🥩 Вяление/Посол", "meats_curing"), ("🥒 Консервация", "veg_preserves")
-    ]
-    for text, category_key in categories:
-        builder.add(InlineKeyboardButton(text=text, callback_data=f"category_{category_key}"))
+    for text, category_key in MAIN_MENU_CATEGORIES:
+        builder.add(InlineKeyboardButton(text=text, callback_data=encode_callback("category", category_key)))
     builder.adjust(2)
     builder.row(InlineKeyboardButton(text="🌍 Кухни Мира", callback_data="show_cuisines"))
     return builder
 
-def get_cuisines_menu_builder() -> InlineKeyboardBuilder:
+def get_cuisines_page_count() -> int:
+    return max(1, -(-len(CATALOGUE.get("cuisine", [])) // CUISINES_PER_PAGE))
+
+def get_cuisines_menu_builder(page: int = 0) -> InlineKeyboardBuilder:
     builder = InlineKeyboardBuilder()
-    cuisines = get_all_cuisines()
-    for cuisine_key in cuisines:
+    cuisines = CATALOGUE.get("cuisine", [])
+    page_count = get_cuisines_page_count()
+    page = min(max(page, 0), page_count - 1)
+    for cuisine_key in cuisines[page * CUISINES_PER_PAGE:(page + 1) * CUISINES_PER_PAGE]:
         cuisine_name = CUISINE_NAMES.get(cuisine_key, cuisine_key.capitalize())
-        builder.add(InlineKeyboardButton(text=cuisine_name, callback_data=f"cuisine_{cuisine_key}"))
+        builder.add(InlineKeyboardButton(text=cuisine_name, callback_data=encode_callback("cuisine", cuisine_key)))
     builder.adjust(2)
+
+    nav_buttons = []
+    if page > 0:
+        nav_buttons.append(InlineKeyboardButton(text="◀️ Назад", callback_data=encode_callback("cuisine_page", page - 1)))
+    if page < page_count - 1:
+        nav_buttons.append(InlineKeyboardButton(text="Дальше ▶️", callback_data=encode_callback("cuisine_page", page + 1)))
+    if nav_buttons:
+        builder.row(*nav_buttons)
     builder.row(InlineKeyboardButton(text="↩️ Главное Меню", callback_data="back_to_main"))
     return builder
 
-async def send_recipe_response(message_or_callback: types.Message | types.CallbackQuery, response_data: dict):
+def build_recipe_keyboard(found_terms: list, related_ids: list, last_menu_context: str) -> InlineKeyboardBuilder:
+    """
+    Собирает единую клавиатуру рецепта: термины, связанные рецепты и кнопка возврата.
+    Если кнопок больше, чем влезает в столбик, сжимает их по две в ряд, а сверх лимита
+    Telegram отбрасывает сначала связанные рецепты, потом термины. Возврат остается всегда.
+    """
+    term_buttons = []
+    if found_terms:
+        terms_db = KNOWLEDGE_BASE.get("terms", {})
+        for term_id in found_terms:
+            term_name = terms_db.get(term_id, {}).get("aliases", ["Неизвестно"])[0]
+            term_buttons.append(InlineKeyboardButton(text=f"🤔 Что такое «{term_name}»?", callback_data=encode_callback("term", term_id)))
+
+    related_buttons = []
+    for recipe_id in related_ids or []:
+        related_recipe = find_recipe_by_id(recipe_id)
+        if related_recipe:
+            related_buttons.append(InlineKeyboardButton(text=f"📜 {related_recipe.title}", callback_data=encode_callback("recipe", recipe_id)))
+
+    budget = TELEGRAM_MAX_KEYBOARD_BUTTONS - 1
+    dropped = max(0, len(term_buttons) + len(related_buttons) - budget)
+    term_buttons = term_buttons[:budget]
+    related_buttons = related_buttons[:budget - len(term_buttons)]
+    if dropped:
+        logging.warning(f"Клавиатура рецепта не влезла в лимит Telegram, отброшено кнопок: {dropped}.")
+
+    per_row = 1 if len(term_buttons) + len(related_buttons) <= RECIPE_KEYBOARD_SINGLE_COLUMN_MAX else 2
+    builder = InlineKeyboardBuilder()
+    for buttons in (term_buttons, related_buttons):
+        for i in range(0, len(buttons), per_row):
+            builder.row(*buttons[i:i + per_row])
+
+    if last_menu_context == 'cuisines':
+        builder.row(InlineKeyboardButton(text="↩️ К списку кухонь", callback_data="show_cuisines"))
+    else:
+        builder.row(InlineKeyboardButton(text="↩️ К категориям", callback_data="back_to_main"))
+    return builder
+
+async def send_recipe_response(message_or_callback: types.Message | types.CallbackQuery, response_data: dict, related_ids: list | None = None):
     user_id = message_or_callback.from_user.id
     target_message = message_or_callback if isinstance(message_or_callback, types.Message) else message_or_callback.message
     
@@ -137,27 +213,15 @@ async def send_recipe_response(message_or_callback: types.Message | types.Callba
         await target_message.answer(response_text, reply_markup=reply_markup)
         return
 
-    builder = InlineKeyboardBuilder()
-    if found_terms:
-        terms_db = KNOWLEDGE_BASE.get("terms", {})
-        for term_id in found_terms:
-            term_name = terms_db.get(term_id, {}).get("aliases", ["Неизвестно"])[0]
-            builder.add(InlineKeyboardButton(text=f"🤔 Что такое «{term_name}»?", callback_data=f"term_{term_id}"))
-        builder.adjust(1)
-    
     session = get_user_session(user_id)
     last_menu_context = session.get("last_menu", "main")
-    
-    if last_menu_context == 'cuisines':
-        builder.row(InlineKeyboardButton(text="↩️ К списку кухонь", callback_data="show_cuisines"))
-    else:
-        builder.row(InlineKeyboardButton(text="↩️ К категориям", callback_data="back_to_main"))
+    builder = build_recipe_keyboard(found_terms, related_ids, last_menu_context)
 
     await target_message.answer(response_text, reply_markup=builder.as_markup())
     logging.info(f"Отправлен рецепт для {user_id} с контекстной кнопкой '{last_menu_context}'.")
 
-async def send_related_recipes_suggestions(message_or_callback: types.Message | types.CallbackQuery, recipe: dict):
-    related_ids = recipe.get("related_recipes")
+async def send_related_recipes_suggestions(message_or_callback: types.Message | types.CallbackQuery, recipe: Recipe):
+    related_ids = recipe.related_recipes
     if not related_ids: return
     
     target_message = message_or_callback if isinstance(message_or_callback, types.Message) else message_or_callback.message
@@ -166,13 +230,21 @@ async def send_related_recipes_suggestions(message_or_callback: types.Message |
     for recipe_id in related_ids:
         related_recipe = find_recipe_by_id(recipe_id)
         if related_recipe:
-            builder.add(InlineKeyboardButton(text=f"📜 {related_recipe['title']}", callback_data=f"show_recipe_{recipe_id}"))
+            builder.add(InlineKeyboardButton(text=f"📜 {related_recipe.title}", callback_data=encode_callback("recipe", recipe_id)))
             found_related_recipes += 1
     if found_related_recipes > 0:
         builder.adjust(1)
         await target_message.answer("Кстати, по этой теме у меня есть и другие протоколы:", reply_markup=builder.as_markup())
         logging.info(f"Пользователю {message_or_callback.from_user.id} предложены связанные рецепты.")
 
+async def send_full_recipe(message_or_callback: types.Message | types.CallbackQuery, response_data: dict, recipe: Recipe):
+    """Отправляет рецепт вместе со связанными: одним сообщением или двумя, в зависимости от COMBINED_RECIPE_KEYBOARD."""
+    if COMBINED_RECIPE_KEYBOARD:
+        await send_recipe_response(message_or_callback, response_data, related_ids=recipe.related_recipes)
+    else:
+        await send_recipe_response(message_or_callback, response_data)
+        await send_related_recipes_suggestions(message_or_callback, recipe)
+
 # --- ОБРАБОТЧИКИ ---
 
 async def show_main_menu(message_or_callback: types.Message | types.CallbackQuery, text: str):
@@ -189,13 +261,15 @@ async def show_main_menu(message_or_callback: types.Message | types.CallbackQuer
         await target_message.answer(text, reply_markup=builder.as_markup(), disable_web_page_preview=True)
     logging.info(f"Пользователю {user_id} показано главное меню.")
 
-async def show_cuisines_menu(callback_query: types.CallbackQuery, text: str):
+async def show_cuisines_menu(callback_query: types.CallbackQuery, text: str, page: int = 0):
     user_id = callback_query.from_user.id
     session = get_user_session(user_id)
     session['last_menu'] = 'cuisines'
-    builder = get_cuisines_menu_builder()
-    await callback_query.message.edit_text(text, reply_markup=builder.as_markup())
-    logging.info(f"Пользователю {user_id} показано меню кухонь.")
+    page = min(max(page, 0), get_cuisines_page_count() - 1)
+    session['cuisine_page'] = page
+    builder = get_cuisines_menu_builder(page)
+    await callback_query.message.edit_text(f"{text} (стр. {page + 1}/{get_cuisines_page_count()})", reply_markup=builder.as_markup())
+    logging.info(f"Пользователю {user_id} показана страница {page} меню кухонь.")
 
 @dp.message(Command("start", "help"))
 async def start_command(message: types.Message):
@@ -228,7 +302,8 @@ async def back_to_main_callback(callback_query: types.CallbackQuery):
 @dp.callback_query(F.data == "show_cuisines")
 async def show_cuisines_callback(callback_query: types.CallbackQuery):
     await callback_query.answer()
-    await show_cuisines_menu(callback_query, "Выбери кулинарную доктрину, которую хочешь изучить.")
+    session = get_user_session(callback_query.from_user.id)
+    await show_cuisines_menu(callback_query, "Выбери кулинарную доктрину, которую хочешь изучить.", session["cuisine_page"])
 
 @dp.message()
 async def handle_ingredients(message: types.Message):
@@ -238,35 +313,25 @@ async def handle_ingredients(message: types.Message):
     logging.info(f"Получен ручной запрос от {user_id}: '{user_query}'")
     get_user_session(user_id)['last_menu'] = 'main'
 
-    intended_recipe = find_recipe_by_intention(user_query)
-    if intended_recipe:
-        response_data = assemble_recipe(intended_recipe)
-        await send_recipe_response(message, response_data)
-        await send_related_recipes_suggestions(message, intended_recipe)
+    try:
+        result = await SYNTHESIS_EXECUTOR.run(resolve_free_text_query, user_query, CATEGORY_ALIASES)
+    except SynthesisOverloaded:
+        logging.warning(f"Очередь синтезатора переполнена, запрос {user_id} отклонен.")
+        await message.answer("У меня тут очередь из таких же умников. Повтори через минуту.")
         return
-
-    found_category = None
-    for category_key, aliases in CATEGORY_ALIASES.items():
-        if user_query in aliases:
-            found_category = category_key
-            break
-    
-    if found_category:
-        random_recipe = find_random_recipe_by_category(found_category)
-        if random_recipe:
-            response_data = assemble_recipe(random_recipe)
-            await send_recipe_response(message, response_data)
-            await send_related_recipes_suggestions(message, random_recipe)
-        else:
-            await message.answer(f"В категории «{found_category}» пока пусто.")
+    except asyncio.TimeoutError:
+        logging.warning(f"Синтезатор не уложился в {SYNTHESIS_EXECUTOR.timeout}с для запроса {user_id}: '{user_query}'")
+        await message.answer("Я слишком долго думала над твоим холодильником и передумала. Сформулируй покороче.")
         return
 
-    response_data = synthesize_response(user_query)
-    await send_recipe_response(message, response_data)
+    if result["kind"] == "recipe":
+        await send_full_recipe(message, result["response"], result["recipe"])
+    elif result["kind"] == "empty_category":
+        await message.answer(f"В категории «{result['category']}» пока пусто.")
+    else:
+        await send_recipe_response(message, result["response"])
 
-@dp.callback_query(F.data.startswith("term_"))
-async def process_term_callback(callback_query: types.CallbackQuery):
-    term_id = callback_query.data.split("_", 1)[1]
+async def process_term_callback(callback_query: types.CallbackQuery, term_id: str):
     terms_db = KNOWLEDGE_BASE.get("terms", {})
     term_data = terms_db.get(term_id)
     await callback_query.answer()
@@ -279,21 +344,23 @@ async def process_term_callback(callback_query: types.CallbackQuery):
     else:
         await callback_query.message.answer("Упс... Я забыла, что это значит. Бывает.")
 
-@dp.callback_query(F.data.startswith("cuisine_"))
-async def process_cuisine_callback(callback_query: types.CallbackQuery):
+async def process_cuisine_page_callback(callback_query: types.CallbackQuery, page: int):
+    await callback_query.answer()
+    await show_cuisines_menu(callback_query, "Выбери кулинарную доктрину, которую хочешь изучить.", page)
+
+async def process_cuisine_callback(callback_query: types.CallbackQuery, cuisine: str):
     user_id = callback_query.from_user.id
-    cuisine = callback_query.data.split("_", 1)[1]
     await callback_query.answer()
     session = get_user_session(user_id)
     session['last_menu'] = 'cuisines'
 
-    recipes_in_cuisine = [r for r in KNOWLEDGE_BASE.get("recipes", []) if r.get("cuisine") == cuisine]
+    recipes_in_cuisine = [r for r in KNOWLEDGE_BASE.get("recipes", []) if r.cuisine == cuisine]
     if not recipes_in_cuisine:
         await callback_query.message.edit_text(f"В доктрине «{CUISINE_NAMES.get(cuisine, cuisine)}» пока пусто. Я это запомню.")
         return
 
     seen_in_cuisine = session["seen_recipes_cuisine"].setdefault(cuisine, set())
-    available_recipes = [r for r in recipes_in_cuisine if r['id'] not in seen_in_cuisine]
+    available_recipes = [r for r in recipes_in_cuisine if r.id not in seen_in_cuisine]
     
     if not available_recipes:
         await callback_query.message.answer(f"Кстати, ты только что изучил все протоколы доктрины «{CUISINE_NAMES.get(cuisine, cuisine)}». Начинаем новый цикл познания.")
@@ -301,29 +368,26 @@ async def process_cuisine_callback(callback_query: types.CallbackQuery):
         available_recipes = recipes_in_cuisine
 
     chosen_recipe = random.choice(available_recipes)
-    seen_in_cuisine.add(chosen_recipe['id'])
+    seen_in_cuisine.add(chosen_recipe.id)
 
     response_data = assemble_recipe(chosen_recipe)
-    await send_recipe_response(callback_query, response_data)
-    await send_related_recipes_suggestions(callback_query, chosen_recipe)
+    await send_full_recipe(callback_query, response_data, chosen_recipe)
 
-@dp.callback_query(F.data.startswith("category_"))
-async def process_category_callback(callback_query: types.CallbackQuery):
+async def process_category_callback(callback_query: types.CallbackQuery, category: str):
     user_id = callback_query.from_user.id
-    category = callback_query.data.split("_", 1)[1]
     session = get_user_session(user_id)
     session['last_menu'] = 'main'
     await callback_query.answer()
 
     recipes_db = KNOWLEDGE_BASE.get("recipes", [])
-    candidates = [recipe for recipe in recipes_db if recipe.get("category") == category]
+    candidates = [recipe for recipe in recipes_db if recipe.category == category]
     
     if not candidates:
         await callback_query.message.edit_text(f"В категории «{category}» пока пусто.")
         return
         
     seen_in_category = session["seen_recipes"].setdefault(category, set())
-    available_recipes = [r for r in candidates if r['id'] not in seen_in_category]
+    available_recipes = [r for r in candidates if r.id not in seen_in_category]
 
     if not available_recipes:
         await callback_query.message.answer(f"Кстати, ты только что посмотрел все рецепты в категории «{category}». Начинаем новый круг.")
@@ -331,27 +395,42 @@ async def process_category_callback(callback_query: types.CallbackQuery):
         available_recipes = candidates
 
     chosen_recipe = random.choice(available_recipes)
-    seen_in_category.add(chosen_recipe['id'])
+    seen_in_category.add(chosen_recipe.id)
 
     response_data = assemble_recipe(chosen_recipe)
-    await send_recipe_response(callback_query, response_data)
-    await send_related_recipes_suggestions(callback_query, chosen_recipe)
+    await send_full_recipe(callback_query, response_data, chosen_recipe)
 
-@dp.callback_query(F.data.startswith("show_recipe_"))
-async def process_show_recipe_callback(callback_query: types.CallbackQuery):
+async def process_show_recipe_callback(callback_query: types.CallbackQuery, recipe_id: str):
     await callback_query.answer()
-    recipe_id = callback_query.data.removeprefix("show_recipe_")
     chosen_recipe = find_recipe_by_id(recipe_id)
 
     if chosen_recipe:
         response_data = assemble_recipe(chosen_recipe)
-        await send_recipe_response(callback_query, response_data)
-        await send_related_recipes_suggestions(callback_query, chosen_recipe)
+        await send_full_recipe(callback_query, response_data, chosen_recipe)
     else:
         logging.error(f"КРИТИЧЕСКАЯ ОШИБКА: Не найден рецепт с ID '{recipe_id}'!")
         await callback_query.message.answer("Извини, этот рецепт куда-то пропал из моей памяти.")
         await show_main_menu(callback_query, "Попробуй выбрать что-то другое.")
 
+# ТАБЛИЦА ДИСПЕТЧЕРИЗАЦИИ: вид из callback_codec -> обработчик(callback_query, ключ)
+CALLBACK_HANDLERS = {
+    "term": process_term_callback,
+    "cuisine": process_cuisine_callback,
+    "cuisine_page": process_cuisine_page_callback,
+    "category": process_category_callback,
+    "recipe": process_show_recipe_callback,
+}
+
+@dp.callback_query()
+async def dispatch_coded_callback(callback_query: types.CallbackQuery):
+    decoded = decode_callback(callback_query.data)
+    if not decoded:
+        logging.warning(f"Неизвестная или устаревшая callback_data от {callback_query.from_user.id}: '{callback_query.data}'")
+        await callback_query.answer("Эта кнопка протухла. Открой меню заново.")
+        return
+    kind, key = decoded
+    await CALLBACK_HANDLERS[kind](callback_query, key)
+
 # --- ЗАПУСК БОТА ---
 
 async def main():
@@ -360,9 +439,13 @@ async def main():
     except Exception as e:
         logging.critical(f"Не удалось запустить бота: {e}", exc_info=True)
         return
+    await SYNTHESIS_EXECUTOR.start()
     await bot.delete_webhook(drop_pending_updates=True)
     logging.info("Шеф-садист (на атомном ядре) входит в чат...")
-    await dp.start_polling(bot)
+    try:
+        await dp.start_polling(bot)
+    finally:
+        SYNTHESIS_EXECUTOR.shutdown()
 
 if __name__ == "__main__":
     logging.info("Запуск локальной версии...")
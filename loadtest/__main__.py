@@ -0,0 +1,237 @@
+"""
+Нагрузочный прогон бота против локального фейкового Bot API.
+
+Запуск из корня репозитория (нужна папка data/):
+    python -m loadtest --users 2000 --duration 60 --mix start=1,menu=2,category=3,cuisine=3,recipe=1,text=2
+
+Каждый симулированный пользователь шлет следующий апдейт только после того, как бот
+закончил обработку предыдущего. В конце печатается пропускная способность,
+перцентили задержки на апдейт и число исходящих вызовов Bot API на апдейт.
+"""
+import argparse
+import asyncio
+import importlib
+import itertools
+import logging
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from aiogram.exceptions import TelegramRetryAfter
+
+from loadtest.fake_bot_api import FakeBotAPI
+from utils.synthesis_executor import SynthesisExecutor, percentile_ms
+
+ACTIONS = ("start", "menu", "category", "cuisine", "recipe", "text")
+DEFAULT_MIX = "start=1,menu=2,category=3,cuisine=3,recipe=1,text=2"
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    weights = {}
+    for part in mix.split(","):
+        action, _, weight = part.partition("=")
+        weights[action.strip()] = float(weight)
+    unknown = set(weights) - set(ACTIONS)
+    if unknown:
+        raise ValueError(f"Неизвестные действия в --mix: {sorted(unknown)}. Допустимы: {sorted(ACTIONS)}")
+    return weights
+
+
+class LoadTest:
+    """Генерирует апдейты от лица пользователей и меряет, сколько бот тратит на каждый."""
+
+    def __init__(self, bot_module, api: FakeBotAPI, weights: Dict[str, float], think_time: float, update_timeout: float):
+        self.bot_module = bot_module
+        self.api = api
+        self.actions = list(weights)
+        self.weights = list(weights.values())
+        self.think_time = think_time
+        self.update_timeout = update_timeout
+        self._update_ids = itertools.count(1)
+        self._in_flight: Dict[int, Dict[str, Any]] = {}
+        self._in_flight_by_user: Dict[int, int] = {}
+        self.latencies: Dict[str, List[float]] = {action: [] for action in ACTIONS}
+        self.outgoing_calls = 0
+        self.completed = 0
+        self.lost = 0
+        self.errors = 0
+        self.rate_limited = 0
+
+        main_menu = bot_module.get_main_menu_builder().as_markup().inline_keyboard
+        self.category_callbacks = [b.callback_data for row in main_menu for b in row if b.callback_data != "show_cuisines"]
+        self.cuisine_callbacks = []
+        for page in range(bot_module.get_cuisines_page_count()):
+            for row in bot_module.get_cuisines_menu_builder(page).as_markup().inline_keyboard:
+                self.cuisine_callbacks.extend(b.callback_data for b in row if b.callback_data != "back_to_main")
+        recipes = bot_module.KNOWLEDGE_BASE["recipes"]
+        self.recipe_callbacks = [bot_module.encode_callback("recipe", recipe.id) for recipe in recipes]
+        self.intention_queries = [alias for recipe in recipes for alias in recipe.intention_aliases or ()]
+        self.ingredient_aliases = [alias for ingredient in bot_module.KNOWLEDGE_BASE["ingredients"].values() for alias in ingredient.aliases]
+
+    # --- учет ---
+
+    async def track_update(self, handler, event, data):
+        """Outer-middleware диспетчера: отмечает апдейт обработанным, даже если хендлер упал."""
+        try:
+            return await handler(event, data)
+        except TelegramRetryAfter:
+            # Впрыснутый 429: хендлер бросил ответ пользователю на полпути. Это не баг бота.
+            self.rate_limited += 1
+            raise
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            pending = self._in_flight.pop(event.update_id, None)
+            if pending:
+                self._in_flight_by_user.pop(pending["user_id"], None)
+                self.latencies[pending["action"]].append(time.perf_counter() - pending["sent_at"])
+                self.completed += 1
+                pending["done"].set()
+
+    def on_call(self, method: str, chat_id: Optional[int]):
+        if chat_id in self._in_flight_by_user:
+            self.outgoing_calls += 1
+
+    # --- генерация апдейтов ---
+
+    def build_update(self, action: str, user_id: int) -> Dict[str, Any]:
+        user = {"id": user_id, "is_bot": False, "first_name": f"Load{user_id}", "language_code": "ru"}
+        chat = {"id": user_id, "type": "private"}
+        now = int(time.time())
+        if action in ("start", "text"):
+            if action == "start":
+                text = "/start"
+            elif self.intention_queries and random.random() < 0.3:
+                text = random.choice(self.intention_queries)
+            else:
+                text = ", ".join(random.sample(self.ingredient_aliases, random.randint(2, 6)))
+            message = {"message_id": random.randint(1, 10 ** 6), "date": now, "chat": chat, "from": user, "text": text}
+            if action == "start":
+                message["entities"] = [{"type": "bot_command", "offset": 0, "length": len(text)}]
+            return {"message": message}
+
+        data = {
+            "menu": lambda: random.choice(("back_to_main", "show_cuisines")),
+            "category": lambda: random.choice(self.category_callbacks),
+            "cuisine": lambda: random.choice(self.cuisine_callbacks),
+            "recipe": lambda: random.choice(self.recipe_callbacks),
+        }[action]()
+        clicked_message = {"message_id": random.randint(1, 10 ** 6), "date": now, "chat": chat,
+                           "from": {"id": 1, "is_bot": True, "first_name": "ChefSadist"}, "text": "..."}
+        return {"callback_query": {"id": str(user_id), "from": user, "chat_instance": str(user_id),
+                                   "message": clicked_message, "data": data}}
+
+    async def send(self, action: str, user_id: int):
+        update = self.build_update(action, user_id)
+        update_id = next(self._update_ids)
+        update["update_id"] = update_id
+        done = asyncio.Event()
+        self._in_flight[update_id] = {"action": action, "user_id": user_id, "sent_at": time.perf_counter(), "done": done}
+        self._in_flight_by_user[user_id] = update_id
+        self.api.push_update(update)
+        try:
+            await asyncio.wait_for(done.wait(), self.update_timeout)
+        except asyncio.TimeoutError:
+            self.lost += 1
+            self._in_flight.pop(update_id, None)
+            self._in_flight_by_user.pop(user_id, None)
+
+    async def simulate_user(self, user_id: int, deadline: float):
+        await self.send("start", user_id)
+        while time.perf_counter() < deadline:
+            action = random.choices(self.actions, self.weights)[0]
+            await self.send(action, user_id)
+            if self.think_time:
+                await asyncio.sleep(random.uniform(0, 2 * self.think_time))
+
+    # --- отчет ---
+
+    def report(self, elapsed: float) -> str:
+        all_latencies = [value for values in self.latencies.values() for value in values]
+        lines = [
+            f"Обработано апдейтов: {self.completed} за {elapsed:.1f}с, потеряно по таймауту: {self.lost}",
+            f"Оборвано впрыснутым 429: {self.rate_limited}, упало в хендлерах по другим причинам: {self.errors}",
+            f"Пропускная способность: {self.completed / elapsed:.1f} апдейтов/с",
+            f"Задержка, мс: p50={percentile_ms(all_latencies, 0.5):.1f} p90={percentile_ms(all_latencies, 0.9):.1f} "
+            f"p99={percentile_ms(all_latencies, 0.99):.1f} max={max(all_latencies, default=0) * 1000:.1f}",
+        ]
+        for action, values in self.latencies.items():
+            if values:
+                lines.append(f"  {action:<9} n={len(values):<7} p50={percentile_ms(values, 0.5):.1f} p99={percentile_ms(values, 0.99):.1f}")
+        calls_by_method = ", ".join(f"{method}={count}" for method, count in sorted(self.api.calls.items()))
+        lines.append(f"Исходящих вызовов на апдейт: {self.outgoing_calls / max(1, self.completed):.2f} ({calls_by_method})")
+        lines.append(f"Впрыснуто 429: {self.api.injected_429}")
+        lines.append(f"Синтезатор (перцентили — за весь прогон): {self.bot_module.SYNTHESIS_EXECUTOR.get_stats()}")
+        return "\n".join(lines)
+
+
+async def run(args):
+    os.environ.setdefault("TELEGRAM_TOKEN_V2", "123456:LOADTEST")
+    os.environ["TELEGRAM_API_SERVER"] = f"http://127.0.0.1:{args.port}"
+    bot_module = importlib.import_module("bot")
+    # Бот пишет WARNING на каждый пустой поиск и переполнение очереди — итог все равно будет в отчете.
+    logging.getLogger().setLevel(logging.ERROR)
+    # Упавшие хендлеры (в том числе от впрыснутых 429) aiogram логирует с трейсбеком; они уже посчитаны в отчете.
+    logging.getLogger("aiogram.event").setLevel(logging.CRITICAL)
+    bot, dp = bot_module.bot, bot_module.dp
+
+    bot_module.load_knowledge_base()
+    # Те же SYNTHESIS_*, что у бота, но замеры копятся за весь прогон, а не в скользящем окне.
+    bot_module.SYNTHESIS_EXECUTOR = SynthesisExecutor.from_env(stats_every=0, stats_window=None)
+    await bot_module.SYNTHESIS_EXECUTOR.start()
+    api = FakeBotAPI(rate_429=args.rate_429, retry_after=args.retry_after)
+    load_test = LoadTest(bot_module, api, parse_mix(args.mix), args.think_time, args.update_timeout)
+    api.on_call = load_test.on_call
+    dp.update.outer_middleware(load_test.track_update)
+    await api.start(port=args.port)
+
+    webhook_runner = None
+    if args.delivery == "webhook":
+        from aiohttp import web
+        from aiogram.webhook.aiohttp_server import SimpleRequestHandler
+        app = web.Application()
+        SimpleRequestHandler(dispatcher=dp, bot=bot).register(app, path="/webhook")
+        webhook_runner = web.AppRunner(app, access_log=None)
+        await webhook_runner.setup()
+        await web.TCPSite(webhook_runner, "127.0.0.1", args.port + 1).start()
+        await bot.set_webhook(f"http://127.0.0.1:{args.port + 1}/webhook")
+        polling = None
+    else:
+        polling = asyncio.create_task(dp.start_polling(bot, handle_signals=False, polling_timeout=1))
+
+    started_at = time.perf_counter()
+    deadline = started_at + args.duration
+    await asyncio.gather(*(load_test.simulate_user(args.first_user_id + i, deadline) for i in range(args.users)))
+    elapsed = time.perf_counter() - started_at
+
+    if polling:
+        await dp.stop_polling()
+        await polling
+    else:
+        await webhook_runner.cleanup()
+        await bot.session.close()
+    await api.stop()
+    bot_module.SYNTHESIS_EXECUTOR.shutdown()
+    print(load_test.report(elapsed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Нагрузочный прогон бота против фейкового Bot API.")
+    parser.add_argument("--users", type=int, default=1000, help="число одновременных симулированных пользователей")
+    parser.add_argument("--duration", type=float, default=30, help="длительность прогона, секунд")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"веса действий, по умолчанию {DEFAULT_MIX}")
+    parser.add_argument("--think-time", type=float, default=0.0, help="средняя пауза пользователя между действиями, секунд")
+    parser.add_argument("--delivery", choices=("polling", "webhook"), default="polling")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="доля исходящих вызовов, на которые отвечать 429")
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--update-timeout", type=float, default=30, help="через сколько секунд считать апдейт потерянным")
+    parser.add_argument("--port", type=int, default=8081, help="порт фейкового Bot API (вебхук бота — на port+1)")
+    parser.add_argument("--first-user-id", type=int, default=10 ** 6)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
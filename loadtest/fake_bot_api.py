@@ -0,0 +1,138 @@
+import asyncio
+import itertools
+import json
+import logging
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from aiohttp import ClientSession, web
+
+# Методы, которые бот шлет в ответ пользователям. Только на них считаются исходящие
+# вызовы и только в них впрыскивается 429: служебные getUpdates/getMe не в счет.
+OUTGOING_METHODS = {"sendMessage", "editMessageText", "answerCallbackQuery", "sendPhoto"}
+
+FAKE_BOT_USER = {"id": 1, "is_bot": True, "first_name": "ChefSadist", "username": "chef_sadist_loadtest_bot"}
+
+
+class FakeBotAPI:
+    """
+    Локальная подделка Telegram Bot API для нагрузочных тестов.
+    Отдает апдейты через getUpdates (long polling) или POST'ит их на вебхук,
+    принимает sendMessage, editMessageText, answerCallbackQuery, sendPhoto
+    и с вероятностью rate_429 отвечает на них "Too Many Requests".
+    """
+
+    def __init__(self, rate_429: float = 0.0, retry_after: int = 1,
+                 on_call: Optional[Callable[[str, Optional[int]], None]] = None):
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.on_call = on_call
+        self.webhook_url: Optional[str] = None
+        self.calls: Dict[str, int] = {}
+        self.injected_429 = 0
+        self._pending: List[Dict[str, Any]] = []
+        self._has_updates = asyncio.Event()
+        self._message_ids = itertools.count(1000)
+        self._client: Optional[ClientSession] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8081):
+        app = web.Application()
+        app.router.add_post("/{bot_token}/{method}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        self._client = ClientSession()
+        logging.info(f"Фейковый Bot API слушает http://{host}:{port}")
+
+    async def stop(self):
+        if self._client is not None:
+            await self._client.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def push_update(self, update: Dict[str, Any]):
+        """Ставит апдейт в доставку: в очередь getUpdates или на вебхук, если он задан."""
+        if self.webhook_url:
+            asyncio.create_task(self._deliver_webhook(update))
+        else:
+            self._pending.append(update)
+            self._has_updates.set()
+
+    async def _deliver_webhook(self, update: Dict[str, Any]):
+        try:
+            async with self._client.post(self.webhook_url, json=update) as response:
+                await response.read()
+        except Exception as e:
+            logging.error(f"Не удалось доставить апдейт {update['update_id']} на вебхук: {e}")
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        if request.content_type == "application/json":
+            params = await request.json()
+        else:
+            params = dict(await request.post())
+
+        if method in OUTGOING_METHODS:
+            self.calls[method] = self.calls.get(method, 0) + 1
+            chat_id = params.get("chat_id")
+            if chat_id is None and method == "answerCallbackQuery":
+                # У answerCallbackQuery нет chat_id; харнесс выдает callback_query.id = id пользователя.
+                chat_id = params.get("callback_query_id")
+            if self.on_call:
+                self.on_call(method, int(chat_id) if chat_id is not None else None)
+            if self.rate_429 and random.random() < self.rate_429:
+                self.injected_429 += 1
+                return web.json_response({
+                    "ok": False, "error_code": 429,
+                    "description": f"Too Many Requests: retry after {self.retry_after}",
+                    "parameters": {"retry_after": self.retry_after},
+                }, status=429)
+
+        if method == "getUpdates":
+            result = await self._get_updates(params)
+        elif method == "getMe":
+            result = FAKE_BOT_USER
+        elif method == "setWebhook":
+            self.webhook_url = params.get("url")
+            result = True
+        elif method == "deleteWebhook":
+            self.webhook_url = None
+            result = True
+        elif method in ("sendMessage", "editMessageText", "sendPhoto"):
+            result = self._make_message(params, photo=method == "sendPhoto")
+        else:
+            result = True
+        return web.json_response({"ok": True, "result": result})
+
+    async def _get_updates(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        offset = int(params.get("offset") or 0)
+        limit = int(params.get("limit") or 100)
+        timeout = float(params.get("timeout") or 0)
+        self._pending = [update for update in self._pending if update["update_id"] >= offset]
+        if not self._pending and timeout:
+            self._has_updates.clear()
+            try:
+                await asyncio.wait_for(self._has_updates.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self._pending[:limit]
+
+    def _make_message(self, params: Dict[str, Any], photo: bool = False) -> Dict[str, Any]:
+        chat_id = int(params["chat_id"])
+        message = {
+            "message_id": int(params.get("message_id") or next(self._message_ids)),
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private"},
+            "from": FAKE_BOT_USER,
+        }
+        if photo:
+            message["photo"] = [{"file_id": str(params.get("photo")), "file_unique_id": "loadtest", "width": 1, "height": 1}]
+            message["caption"] = params.get("caption", "")
+        else:
+            message["text"] = params.get("text", "")
+        reply_markup = params.get("reply_markup")
+        if reply_markup:
+            message["reply_markup"] = json.loads(reply_markup) if isinstance(reply_markup, str) else reply_markup
+        return message
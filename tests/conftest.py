@@ -0,0 +1,17 @@
+import os
+
+import pytest
+
+# bot.py требует токен при импорте; настоящий не нужен, в сеть тесты не ходят.
+os.environ.setdefault("TELEGRAM_TOKEN_V2", "123456:TEST")
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def knowledge_base():
+    """База знаний читается из data/ относительно текущей папки, поэтому тесты запускаются из корня."""
+    os.chdir(REPO_ROOT)
+    from utils.recipe_synthesizer import KNOWLEDGE_BASE, load_knowledge_base
+    load_knowledge_base()
+    return KNOWLEDGE_BASE
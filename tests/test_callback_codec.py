@@ -0,0 +1,82 @@
+import pytest
+
+import bot
+from utils import callback_codec
+from utils.callback_codec import CATALOGUE, build_catalogue, decode_callback, encode_callback
+from utils.knowledge_records import Recipe
+
+
+@pytest.fixture
+def restore_catalogue(knowledge_base):
+    yield
+    build_catalogue(knowledge_base)
+
+
+@pytest.mark.parametrize("kind", ["recipe", "cuisine", "term", "category"])
+def test_round_trip_for_every_key(kind):
+    for key in CATALOGUE[kind]:
+        data = encode_callback(kind, key)
+        assert len(data.encode("utf-8")) <= 64
+        assert decode_callback(data) == (kind, key)
+
+
+def test_cuisine_page_round_trip():
+    assert decode_callback(encode_callback("cuisine_page", 3)) == ("cuisine_page", 3)
+
+
+@pytest.mark.parametrize("data, expected", [
+    ("show_recipe_student_pasta", ("recipe", "student_pasta")),
+    ("cuisine_italian", ("cuisine", "italian")),
+    ("category_soups", ("category", "soups")),
+    ("term_thermoskaff", ("term", "thermoskaff")),
+])
+def test_legacy_formats_still_decode(data, expected):
+    assert decode_callback(data) == expected
+
+
+@pytest.mark.parametrize("data", ["back_to_main", "show_cuisines", "", "r99999.0000", "r1", "rx.abcd"])
+def test_foreign_or_broken_data_is_rejected(data):
+    assert decode_callback(data) is None
+
+
+def test_codes_do_not_depend_on_recipe_order(knowledge_base, restore_catalogue):
+    before = encode_callback("recipe", "student_pasta")
+    build_catalogue({**knowledge_base, "recipes": list(reversed(knowledge_base["recipes"]))})
+    assert encode_callback("recipe", "student_pasta") == before
+
+
+def test_old_buttons_expire_when_catalogue_changes(knowledge_base, restore_catalogue):
+    old_recipe = encode_callback("recipe", knowledge_base["recipes"][-1].id)
+    old_category = encode_callback("category", "soups")
+    new_recipe = Recipe.from_dict({"id": "aaa_new_recipe", "category": "soups", "cuisine": "italian"})
+    build_catalogue({**knowledge_base, "recipes": [new_recipe] + knowledge_base["recipes"]})
+    assert decode_callback(old_recipe) is None
+    # Список категорий не поменялся — кнопки главного меню живут дальше.
+    assert decode_callback(old_category) == ("category", "soups")
+
+
+def test_menu_categories_without_recipes_are_encodable(knowledge_base, restore_catalogue, monkeypatch):
+    monkeypatch.setattr(callback_codec, "_SEED_CATEGORIES", set(callback_codec._SEED_CATEGORIES))
+    callback_codec.register_categories(["empty_category"])
+    assert decode_callback(encode_callback("category", "empty_category")) == ("category", "empty_category")
+
+    monkeypatch.setattr(bot, "MAIN_MENU_CATEGORIES", bot.MAIN_MENU_CATEGORIES + [("Пусто", "empty_category")])
+    buttons = [button for row in bot.get_main_menu_builder().as_markup().inline_keyboard for button in row]
+    assert any(decode_callback(button.callback_data) == ("category", "empty_category") for button in buttons)
+
+
+def test_all_menu_and_alias_categories_are_in_catalogue():
+    menu_categories = {key for _, key in bot.MAIN_MENU_CATEGORIES}
+    assert menu_categories | set(bot.CATEGORY_ALIASES) <= set(CATALOGUE["category"])
+
+
+def test_cuisine_pages_cover_every_cuisine_once():
+    seen = []
+    page_count = bot.get_cuisines_page_count()
+    for page in range(page_count):
+        rows = bot.get_cuisines_menu_builder(page).as_markup().inline_keyboard
+        decoded = [decode_callback(button.callback_data) for row in rows for button in row]
+        seen += [key for kind, key in filter(None, decoded) if kind == "cuisine"]
+        nav_pages = [key for kind, key in filter(None, decoded) if kind == "cuisine_page"]
+        assert nav_pages == [p for p in (page - 1, page + 1) if 0 <= p < page_count]
+    assert seen == CATALOGUE["cuisine"]
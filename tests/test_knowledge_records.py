@@ -0,0 +1,91 @@
+import pickle
+import sys
+
+import pytest
+
+from utils.knowledge_records import Ingredient, Recipe, RecipeTemplates, Term
+
+RECIPE_DATA = {
+    "id": "test_recipe",
+    "cuisine": "italian",
+    "category": "pasta",
+    "title": "Тестовая паста",
+    "priority": 5,
+    "trigger_keys": ["pasta", "cheese"],
+    "related_recipes": ["student_pasta"],
+    "templates": {"reagents": "r", "procedure": ["шаг 1", "шаг 2"], "effects": "e"},
+}
+
+
+def test_recipe_fields_become_tuples_and_are_interned():
+    recipe = Recipe.from_dict(RECIPE_DATA)
+    assert recipe.trigger_keys == ("pasta", "cheese")
+    assert recipe.templates.procedure == ("шаг 1", "шаг 2")
+    assert recipe.category is sys.intern("pasta")
+    assert recipe.cuisine is sys.intern("italian")
+
+
+def test_duplicate_trigger_keys_are_dropped_in_order():
+    recipe = Recipe.from_dict({**RECIPE_DATA, "trigger_keys": ["pasta", "cheese", "pasta"]})
+    assert recipe.trigger_keys == ("pasta", "cheese")
+
+
+def test_dict_style_read_api():
+    recipe = Recipe.from_dict(RECIPE_DATA)
+    assert recipe["id"] == "test_recipe"
+    assert recipe.get("priority") == 5
+    assert recipe.get("intention_aliases", []) == []
+    assert "cuisine" in recipe
+    assert "intention_aliases" not in recipe
+    assert "no_such_field" not in recipe
+    with pytest.raises(KeyError):
+        recipe["intention_aliases"]
+    with pytest.raises(KeyError):
+        recipe["no_such_field"]
+
+
+def test_records_are_frozen():
+    recipe = Recipe.from_dict(RECIPE_DATA)
+    with pytest.raises(AttributeError):
+        recipe.title = "другое"
+    with pytest.raises(AttributeError):
+        del recipe.title
+    with pytest.raises(AttributeError):
+        recipe.extra = 1
+
+
+def test_ingredient_name_forms_are_read_only_and_shared():
+    first = Ingredient.from_dict("rice", {"aliases": ["рис"], "name_forms": {"nom_sg": "рис", "acc_sg": "рис"}})
+    second = Ingredient.from_dict("rice2", {"aliases": ["рис"], "name_forms": {"nom_sg": "рис"}})
+    assert first.name_forms.get("acc_sg") == "рис"
+    with pytest.raises(TypeError):
+        first.name_forms["acc_sg"] = "mut"
+    assert first.name_forms["nom_sg"] is second.name_forms["nom_sg"] is first.aliases[0]
+
+
+@pytest.mark.parametrize("record", [
+    Recipe.from_dict(RECIPE_DATA),
+    RecipeTemplates.from_dict(RECIPE_DATA["templates"]),
+    Ingredient.from_dict("rice", {"aliases": ["рис"], "name_forms": {"nom_sg": "рис"}}),
+    Term.from_dict({"term_id": "t", "aliases": ["а"], "explanation": "x", "sarcastic_comments": ["y"]}),
+])
+def test_pickle_round_trip_keeps_fields_and_immutability(record):
+    def fields(value):
+        if isinstance(value, (Recipe, RecipeTemplates, Ingredient, Term)):
+            return {name: fields(value.get(name)) for name in value.__slots__}
+        return dict(value) if hasattr(value, "keys") else value
+
+    restored = pickle.loads(pickle.dumps(record))
+    assert type(restored) is type(record)
+    assert fields(restored) == fields(record)
+    with pytest.raises(AttributeError):
+        setattr(restored, record.__slots__[0], "mut")
+    if isinstance(restored, Ingredient):
+        with pytest.raises(TypeError):
+            restored.name_forms["nom_sg"] = "mut"
+
+
+def test_loaded_knowledge_base_uses_records(knowledge_base):
+    assert all(isinstance(recipe, Recipe) for recipe in knowledge_base["recipes"])
+    assert all(isinstance(ingredient, Ingredient) for ingredient in knowledge_base["ingredients"].values())
+    assert all(isinstance(term, Term) for term in knowledge_base["terms"].values())
@@ -0,0 +1,72 @@
+import bot
+from bot import TELEGRAM_MAX_KEYBOARD_BUTTONS, RECIPE_KEYBOARD_SINGLE_COLUMN_MAX, build_recipe_keyboard
+
+
+def recipe_ids(knowledge_base, count):
+    return [recipe.id for recipe in knowledge_base["recipes"][:count]]
+
+
+def keyboard_rows(builder):
+    return builder.as_markup().inline_keyboard
+
+
+def test_single_column_with_back_button_last(knowledge_base):
+    rows = keyboard_rows(build_recipe_keyboard(list(knowledge_base["terms"]), recipe_ids(knowledge_base, 2), "main"))
+    assert all(len(row) == 1 for row in rows)
+    assert len(rows) == len(knowledge_base["terms"]) + 2 + 1
+    assert rows[-1][0].callback_data == "back_to_main"
+
+
+def test_back_button_follows_menu_context(knowledge_base):
+    rows = keyboard_rows(build_recipe_keyboard([], recipe_ids(knowledge_base, 1), "cuisines"))
+    assert rows[-1][0].callback_data == "show_cuisines"
+
+
+def test_packs_two_per_row_past_single_column_max(knowledge_base):
+    related = recipe_ids(knowledge_base, RECIPE_KEYBOARD_SINGLE_COLUMN_MAX + 2)
+    rows = keyboard_rows(build_recipe_keyboard([], related, "main"))
+    assert [len(row) for row in rows[:-1]] == [2] * (len(related) // 2)
+    assert len(rows[-1]) == 1
+
+
+def test_caps_at_telegram_button_limit_and_keeps_back_button(knowledge_base):
+    terms = list(knowledge_base["terms"])
+    related = recipe_ids(knowledge_base, 150)
+    rows = keyboard_rows(build_recipe_keyboard(terms, related, "main"))
+    buttons = [button for row in rows for button in row]
+    assert len(buttons) == TELEGRAM_MAX_KEYBOARD_BUTTONS
+    assert buttons[-1].callback_data == "back_to_main"
+    # Сначала режутся связанные рецепты, термины остаются все.
+    assert sum(button.text.startswith("🤔") for button in buttons) == len(terms)
+    assert all(len(row) <= 8 for row in rows)
+
+
+def test_unknown_related_ids_are_skipped(knowledge_base):
+    rows = keyboard_rows(build_recipe_keyboard([], ["no_such_recipe"], "main"))
+    assert len(rows) == 1
+
+
+def test_send_full_recipe_uses_one_message_when_combined(knowledge_base, monkeypatch):
+    import asyncio
+
+    sent = []
+
+    class FakeMessage:
+        async def answer(self, text, reply_markup=None):
+            sent.append(reply_markup)
+
+    class FakeUser:
+        id = 42
+
+    message = FakeMessage()
+    message.from_user = FakeUser()
+    monkeypatch.setattr(bot.types, "Message", FakeMessage)
+    monkeypatch.setattr(bot, "COMBINED_RECIPE_KEYBOARD", True)
+    recipe = next(r for r in knowledge_base["recipes"] if r.related_recipes)
+    asyncio.run(bot.send_full_recipe(message, bot.assemble_recipe(recipe), recipe))
+    assert len(sent) == 1
+
+    sent.clear()
+    monkeypatch.setattr(bot, "COMBINED_RECIPE_KEYBOARD", False)
+    asyncio.run(bot.send_full_recipe(message, bot.assemble_recipe(recipe), recipe))
+    assert len(sent) == 2
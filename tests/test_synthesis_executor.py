@@ -0,0 +1,83 @@
+import asyncio
+import time
+
+import pytest
+
+from utils.recipe_synthesizer import resolve_free_text_query
+from utils import synthesis_executor
+from utils.synthesis_executor import SynthesisExecutor, SynthesisOverloaded
+
+
+def run_with_executor(mode, scenario, **kwargs):
+    async def main():
+        executor = SynthesisExecutor(mode=mode, **kwargs)
+        await executor.start()
+        try:
+            return await scenario(executor)
+        finally:
+            executor.shutdown()
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("mode", ["inline", "thread", "process"])
+def test_runs_pipeline_in_every_mode(mode):
+    async def scenario(executor):
+        return await executor.run(resolve_free_text_query, "макароны с тушенкой", {})
+
+    result = run_with_executor(mode, scenario)
+    assert result["kind"] == "recipe"
+    assert result["recipe"].id == "student_pasta"
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_timed_out_calls_are_not_counted_as_completed(mode):
+    async def scenario(executor):
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.run(time.sleep, 0.6)
+        await asyncio.sleep(0.5)  # воркер еще досыпает отмененный вызов и держит единственный слот
+        await executor.run(time.sleep, 0)
+        return executor.get_stats()
+
+    stats = run_with_executor(mode, scenario, workers=1, timeout=0.3)
+    assert stats["timeouts"] == 1
+    assert stats["completed"] == 1
+    assert stats["run_p95_ms"] < 300
+
+
+def test_rejects_calls_past_queue_limit():
+    async def scenario(executor):
+        return await asyncio.gather(*(executor.run(time.sleep, 0.1) for _ in range(4)), return_exceptions=True)
+
+    results = run_with_executor("thread", scenario, workers=1, max_queue=2)
+    assert sum(isinstance(result, SynthesisOverloaded) for result in results) == 2
+
+
+def burn_cpu(seconds):
+    """Чистый Python без пауз: держит GIL, в отличие от time.sleep."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_process_pool_keeps_loop_responsive_under_cpu_work(monkeypatch):
+    monkeypatch.setattr(synthesis_executor, "LOOP_LAG_PROBE_INTERVAL", 0.05)
+
+    async def scenario(executor):
+        await asyncio.gather(*(executor.run(burn_cpu, 0.4) for _ in range(4)))
+        return executor.get_stats()
+
+    stats = run_with_executor("process", scenario, workers=2)
+    assert stats["completed"] == 4
+    assert stats["loop_lag_max_ms"] < 100
+
+
+def test_stats_keep_only_last_window_and_survive_periodic_log():
+    async def scenario(executor):
+        for _ in range(7):
+            await executor.run(time.sleep, 0)
+        return executor
+
+    executor = run_with_executor("inline", scenario, stats_every=2, stats_window=3)
+    assert executor.get_stats()["completed"] == 7
+    assert len(executor._run_times) == 3
+    assert len(executor._queue_waits) == 3
@@ -0,0 +1,81 @@
+import hashlib
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Однобуквенные префиксы callback_data. За префиксом идет короткий числовой ID
+# из каталога, собранного при загрузке базы знаний, и через точку — версия каталога
+# этого вида: "r12.3fa0" вместо "show_recipe_<длинный_id>".
+CALLBACK_PREFIXES = {"recipe": "r", "cuisine": "c", "term": "t", "category": "k", "cuisine_page": "p"}
+_KINDS_BY_PREFIX = {prefix: kind for kind, prefix in CALLBACK_PREFIXES.items()}
+VERSION_SEPARATOR = "."
+
+# Старые форматы, которые еще живут в кнопках истории чатов.
+LEGACY_PREFIXES = {"show_recipe_": "recipe", "cuisine_": "cuisine", "term_": "term", "category_": "category"}
+
+CATALOGUE: Dict[str, List[str]] = {}
+CATALOGUE_VERSIONS: Dict[str, str] = {}
+_CATALOGUE_INDEX: Dict[str, Dict[str, int]] = {}
+
+# Категории из меню бота и CATEGORY_ALIASES. Попадают в каталог, даже если рецептов в них пока нет.
+_SEED_CATEGORIES: Set[str] = set()
+
+
+def _set_kind(kind: str, keys: Iterable[str]):
+    """
+    Ключи сортируются, чтобы коды не зависели от порядка файлов и рецептов в них.
+    Версия — короткий хэш списка ключей: стоит добавить или убрать хоть один,
+    и старые кнопки этого вида перестают раскодироваться, а не открывают чужой объект.
+    """
+    ordered = sorted(set(keys))
+    CATALOGUE[kind] = ordered
+    CATALOGUE_VERSIONS[kind] = hashlib.sha1("\n".join(ordered).encode("utf-8")).hexdigest()[:4]
+    _CATALOGUE_INDEX[kind] = {key: index for index, key in enumerate(ordered)}
+
+
+def register_categories(categories: Iterable[str]):
+    """Добавляет в каталог категории, известные боту помимо рецептов (кнопки меню, алиасы)."""
+    _SEED_CATEGORIES.update(categories)
+    if "category" in CATALOGUE:
+        _set_kind("category", set(CATALOGUE["category"]) | _SEED_CATEGORIES)
+
+
+def build_catalogue(knowledge_base: Dict[str, Any]):
+    """Раздает рецептам, кухням, терминам и категориям короткие числовые ID."""
+    recipes = knowledge_base.get("recipes", [])
+    _set_kind("recipe", (recipe.id for recipe in recipes))
+    _set_kind("cuisine", (recipe.cuisine for recipe in recipes if recipe.cuisine))
+    _set_kind("category", _SEED_CATEGORIES | {recipe.category for recipe in recipes if recipe.category})
+    _set_kind("term", knowledge_base.get("terms", {}))
+    logging.info(f"Каталог callback-кодов собран: { {kind: len(keys) for kind, keys in CATALOGUE.items()} }, версии: {CATALOGUE_VERSIONS}")
+
+
+def encode_callback(kind: str, key: Any) -> str:
+    """Кодирует объект в компактную callback_data. Для 'cuisine_page' key — номер страницы."""
+    if kind == "cuisine_page":
+        return f"{CALLBACK_PREFIXES[kind]}{int(key)}"
+    return f"{CALLBACK_PREFIXES[kind]}{_CATALOGUE_INDEX[kind][key]}{VERSION_SEPARATOR}{CATALOGUE_VERSIONS[kind]}"
+
+
+def decode_callback(data: str) -> Optional[Tuple[str, Any]]:
+    """
+    Раскодирует callback_data в пару (вид, ключ). Понимает и старые префиксы вроде 'show_recipe_'.
+    Возвращает None, если данные не относятся к каталогу или каталог с тех пор поменялся.
+    """
+    if not data:
+        return None
+
+    kind = _KINDS_BY_PREFIX.get(data[0])
+    if kind == "cuisine_page" and data[1:].isdigit():
+        return kind, int(data[1:])
+    if kind:
+        index, separator, version = data[1:].partition(VERSION_SEPARATOR)
+        if separator and index.isdigit():
+            keys = CATALOGUE.get(kind, [])
+            if version != CATALOGUE_VERSIONS.get(kind) or int(index) >= len(keys):
+                return None
+            return kind, keys[int(index)]
+
+    for prefix, legacy_kind in LEGACY_PREFIXES.items():
+        if data.startswith(prefix):
+            return legacy_kind, data.removeprefix(prefix)
+    return None
@@ -0,0 +1,122 @@
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, Tuple
+
+
+def _intern_all(values) -> Tuple[str, ...]:
+    return tuple(sys.intern(value) for value in values)
+
+
+def _freeze(value: Any) -> Any:
+    return MappingProxyType(value) if isinstance(value, dict) else value
+
+
+def _restore_record(record_class, values: tuple):
+    record = object.__new__(record_class)
+    for name, value in zip(record_class.__slots__, values):
+        object.__setattr__(record, name, _freeze(value))
+    return record
+
+
+class _Record:
+    """
+    Неизменяемая запись базы знаний на __slots__. Поля читаются как атрибуты,
+    но для старого кода оставлен словарный интерфейс: get(), [] и in.
+    Отсутствующее в JSON поле хранится как None и для get()/in считается отсутствующим.
+    Поля-словари заворачиваются в MappingProxyType, чтобы запись нельзя было поменять и через них.
+    """
+    __slots__ = ()
+
+    def __init__(self, **fields: Any):
+        for name in self.__slots__:
+            object.__setattr__(self, name, _freeze(fields.get(name)))
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} неизменяем: нельзя присвоить '{name}'")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} неизменяем: нельзя удалить '{name}'")
+
+    def __reduce__(self):
+        # Нужен для пула процессов синтезатора: стандартный pickle для __slots__ идет через setattr,
+        # а MappingProxyType не сериализуется вовсе — передаем копию словаря и заворачиваем обратно.
+        values = tuple(getattr(self, name) for name in self.__slots__)
+        return _restore_record, (type(self), tuple(dict(v) if isinstance(v, MappingProxyType) else v for v in values))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key) if key in self.__slots__ else None
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__ or getattr(self, key) is None:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__ and getattr(self, key) is not None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({getattr(self, self.__slots__[0])!r})"
+
+
+class RecipeTemplates(_Record):
+    __slots__ = ("reagents", "procedure", "effects")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RecipeTemplates":
+        procedure = data.get("procedure", ())
+        return cls(
+            reagents=data.get("reagents", ""),
+            procedure=tuple(procedure) if isinstance(procedure, list) else procedure,
+            effects=data.get("effects", ""),
+        )
+
+
+class Recipe(_Record):
+    __slots__ = ("id", "title", "category", "cuisine", "priority", "trigger_keys",
+                 "related_recipes", "intention_aliases", "templates")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Recipe":
+        intention_aliases = data.get("intention_aliases")
+        return cls(
+            id=sys.intern(data["id"]),
+            title=sys.intern(data["title"]) if "title" in data else None,
+            category=sys.intern(data["category"]) if "category" in data else None,
+            cuisine=sys.intern(data["cuisine"]) if "cuisine" in data else None,
+            priority=data.get("priority", 0),
+            # Без повторов: поиск считает совпадения по этому кортежу, а не по множеству.
+            trigger_keys=_intern_all(dict.fromkeys(data.get("trigger_keys", []))),
+            related_recipes=_intern_all(data.get("related_recipes", [])),
+            intention_aliases=_intern_all(intention_aliases) if intention_aliases is not None else None,
+            templates=RecipeTemplates.from_dict(data.get("templates", {})),
+        )
+
+
+class Ingredient(_Record):
+    __slots__ = ("key", "aliases", "scientific_name", "origin_comment", "name_forms")
+
+    @classmethod
+    def from_dict(cls, key: str, data: Dict[str, Any]) -> "Ingredient":
+        # Формы слова и алиасы во многом совпадают между собой ("рис" — и алиас, и nom_sg, и acc_sg),
+        # поэтому интернируются и ключи падежей, и значения.
+        return cls(
+            key=sys.intern(key),
+            aliases=_intern_all(data.get("aliases", [])),
+            scientific_name=data.get("scientific_name"),
+            origin_comment=data.get("origin_comment"),
+            name_forms={sys.intern(form): sys.intern(value) for form, value in data.get("name_forms", {}).items()},
+        )
+
+
+class Term(_Record):
+    __slots__ = ("term_id", "aliases", "explanation", "sarcastic_comments")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Term":
+        return cls(
+            term_id=sys.intern(data["term_id"]),
+            aliases=_intern_all(data.get("aliases", [])),
+            explanation=data.get("explanation"),
+            sarcastic_comments=tuple(data.get("sarcastic_comments", [])),
+        )
@@ -3,14 +3,19 @@ import random
 import re
 import logging
 import os
+import sys
 from typing import Dict, List, Optional, Any
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.types import InlineKeyboardButton
 
+from utils.callback_codec import build_catalogue, encode_callback
+from utils.knowledge_records import Ingredient, Recipe, Term
+
 KNOWLEDGE_BASE: Dict[str, Any] = {}
 
 def load_knowledge_base():
-    """Загружает все JSON файлы из папки data, агрегируя модульные базы."""
+    """Загружает все JSON файлы из папки data, агрегируя модульные базы.
+    Рецепты, ингредиенты и термины превращаются в неизменяемые записи из knowledge_records."""
     global KNOWLEDGE_BASE
     data_path = "data/"
     try:
@@ -18,20 +23,21 @@ def load_knowledge_base():
         ingredient_files = [f for f in os.listdir(data_path) if f.endswith("_ingredients.json")]
         for filename in ingredient_files:
             with open(os.path.join(data_path, filename), "r", encoding="utf-8") as f:
-                KNOWLEDGE_BASE["ingredients"].update(json.load(f))
+                for key, data in json.load(f).items():
+                    KNOWLEDGE_BASE["ingredients"][sys.intern(key)] = Ingredient.from_dict(key, data)
 
         KNOWLEDGE_BASE["recipes"] = []
         recipe_files = [f for f in os.listdir(data_path) if f.endswith("_recipes.json")]
         for filename in recipe_files:
             with open(os.path.join(data_path, filename), "r", encoding="utf-8") as f:
-                KNOWLEDGE_BASE["recipes"].extend(json.load(f))
+                KNOWLEDGE_BASE["recipes"].extend(Recipe.from_dict(recipe) for recipe in json.load(f))
         
         with open(os.path.join(data_path, "phrases.json"), "r", encoding="utf-8") as f:
             KNOWLEDGE_BASE["phrases"] = json.load(f)
 
         with open(os.path.join(data_path, "terms.json"), "r", encoding="utf-8") as f:
             terms_list = json.load(f)
-            KNOWLEDGE_BASE["terms"] = {term["term_id"]: term for term in terms_list}
+            KNOWLEDGE_BASE["terms"] = {sys.intern(term["term_id"]): Term.from_dict(term) for term in terms_list}
         
         if not KNOWLEDGE_BASE["recipes"]:
              raise FileNotFoundError("Не найдено ни одного файла с рецептами")
@@ -40,6 +46,7 @@ def load_knowledge_base():
         if not KNOWLEDGE_BASE["terms"]:
              logging.warning("Файл terms.json пуст или не найден.")
 
+        build_catalogue(KNOWLEDGE_BASE)
         logging.info("База знаний успешно загружена и агрегирована.")
     except Exception as e:
         logging.critical(f"Критическая ошибка загрузки базы знаний: {e}", exc_info=True)
@@ -62,9 +69,7 @@ def parse_user_query(text: str) -> List[str]:
     # в формате (normalized_alias, original_ingredient_key)
     all_search_terms = []
     for key, data in ingredients_db.items():
-        aliases = data.get("aliases", [])
-        aliases.append(key) # Добавляем сам ключ как поисковый термин
-        for alias in aliases:
+        for alias in data.aliases + (key,): # Добавляем сам ключ как поисковый термин
             all_search_terms.append((normalize_text(alias), key))
     
     # Шаг 2: Сортируем список от самых длинных алиасов к самым коротким
@@ -107,13 +112,12 @@ def find_matching_recipe(found_ingredients_keys: List[str]) -> Dict[str, Any]:
     partial_candidates = [] # Список для всех частичных совпадений, которые мы будем анализировать
 
     for recipe in recipes_db:
-        trigger_keys = set(recipe.get("trigger_keys", []))
+        trigger_keys = recipe.trigger_keys
         if not trigger_keys:
             continue
 
-        matching_keys = found_set.intersection(trigger_keys)
-        missing_keys = trigger_keys - found_set
-        excess_keys = found_set - trigger_keys # Ингредиенты пользователя, которые не нужны рецепту
+        missing_keys = [key for key in trigger_keys if key not in found_set]
+        match_count = len(trigger_keys) - len(missing_keys)
         
         # Если все ключи на месте — это идеальный кандидат
         if not missing_keys:
@@ -122,7 +126,8 @@ def find_matching_recipe(found_ingredients_keys: List[str]) -> Dict[str, Any]:
 
         # Если есть хотя бы одно совпадение, но не все — это частичный кандидат
         # Добавляем условие, что не хватать должно не более 2-х ингредиентов (старое правило)
-        if matching_keys and len(missing_keys) <= 2:
+        if match_count and len(missing_keys) <= 2:
+            excess_keys = found_set.difference(trigger_keys) # Ингредиенты пользователя, которые не нужны рецепту
             # Новая метрика релевантности:
             # Приоритет:
             # 1. Больше совпадений (match_count)
@@ -130,24 +135,24 @@ def find_matching_recipe(found_ingredients_keys: List[str]) -> Dict[str, Any]:
             # 3. Меньше лишних ингредиентов (len(excess_keys))
             # 4. Выше приоритет рецепта (recipe.get("priority"))
             relevance_score = (
-                len(matching_keys),
+                match_count,
                 -len(missing_keys), # Минусы, потому что мы хотим МЕНЬШЕ недостающих
                 -len(excess_keys),  # Минусы, потому что мы хотим МЕНЬШЕ лишних
-                recipe.get("priority", 0)
+                recipe.priority
             )
 
             partial_candidates.append({
                 "recipe": recipe,
-                "match_count": len(matching_keys),
-                "missing_keys": list(missing_keys),
+                "match_count": match_count,
+                "missing_keys": missing_keys,
                 "excess_keys": list(excess_keys), # Добавлено для отладки
                 "score": relevance_score # Новое поле для сортировки
             })
 
     # Сначала всегда отдаем предпочтение идеальным совпадениям
     if perfect_matches:
-        best_candidate = sorted(perfect_matches, key=lambda r: r.get("priority", 0), reverse=True)[0]
-        logging.info(f"Найдено идеальное совпадение: '{best_candidate.get('id')}'")
+        best_candidate = sorted(perfect_matches, key=lambda r: r.priority, reverse=True)[0]
+        logging.info(f"Найдено идеальное совпадение: '{best_candidate.id}'")
         return {"status": "perfect", "recipe": best_candidate, "options": [], "missing_keys": []}
 
     # Если идеальных нет, ищем ЛУЧШЕЕ из частичных или несколько лучших
@@ -167,7 +172,7 @@ def find_matching_recipe(found_ingredients_keys: List[str]) -> Dict[str, Any]:
                 break
 
         if top_options:
-            logging.info(f"Найдено {len(top_options)} частичных совпадений. Лучшие: {[p['recipe'].get('id') for p in top_options]}")
+            logging.info(f"Найдено {len(top_options)} частичных совпадений. Лучшие: {[p['recipe'].id for p in top_options]}")
             return {"status": "partial_options", "options": top_options, "recipe": None, "missing_keys": []}
 
     logging.warning(f"Для набора {found_ingredients_keys} не найдено ни идеальных, ни частичных совпадений.")
@@ -179,21 +184,20 @@ def find_terms_in_text(text: str) -> List[str]:
     terms_db = KNOWLEDGE_BASE.get("terms", {})
     
     for term_id, term_data in terms_db.items():
-        aliases = term_data.get("aliases", [])
-        for alias in aliases:
+        for alias in term_data.aliases:
             if re.search(r'\b' + re.escape(alias.lower()) + r'\b', text.lower()):
                 found_term_ids.add(term_id)
                 break
                 
     return list(found_term_ids)
 
-def find_random_recipe_by_category(category: str) -> Optional[Dict[str, Any]]:
+def find_random_recipe_by_category(category: str) -> Optional[Recipe]:
     """Находит случайный рецепт по заданной категории."""
     recipes_db = KNOWLEDGE_BASE.get("recipes", [])
     
     candidates = [
         recipe for recipe in recipes_db 
-        if recipe.get("category") == category
+        if recipe.category == category
     ]
     
     if not candidates:
@@ -201,19 +205,19 @@ def find_random_recipe_by_category(category: str) -> Optional[Dict[str, Any]]:
         return None
     
     chosen_recipe = random.choice(candidates)
-    logging.info(f"По категории '{category}' был случайно выбран рецепт '{chosen_recipe.get('id')}'.")
+    logging.info(f"По категории '{category}' был случайно выбран рецепт '{chosen_recipe.id}'.")
     
     return chosen_recipe
 
-def assemble_recipe(recipe_template: Dict) -> Dict[str, Any]:
+def assemble_recipe(recipe_template: Recipe) -> Dict[str, Any]:
     """Собирает финальный текст рецепта и СПИСОК НАЙДЕННЫХ ТЕРМИНОВ."""
     phrases = KNOWLEDGE_BASE.get("phrases", {})
     ingredients_db = KNOWLEDGE_BASE.get("ingredients", {})
     
     # ИЗМЕНЕНИЕ: Берем статичный заголовок
-    title = recipe_template.get("title", "Эксперимент без названия")
+    title = recipe_template.title or "Эксперимент без названия"
 
-    templates = recipe_template.get("templates", {})
+    templates = recipe_template.templates
     
     def replacer(match):
         full_placeholder = match.group(0)
@@ -223,17 +227,17 @@ def assemble_recipe(recipe_template: Dict) -> Dict[str, Any]:
             return random.choice(phrases.get("sarcastic_comments", [""]))
         if key in ingredients_db:
             if form == "scientific_name":
-                return ingredients_db[key].get("scientific_name", key)
-            return ingredients_db[key].get("name_forms", {}).get(form, key)
+                return ingredients_db[key].scientific_name or key
+            return ingredients_db[key].name_forms.get(form, key)
         return full_placeholder
 
-    reagents = re.sub(r'{(\w+):?(\w+)?}', replacer, templates.get("reagents", ""))
-    effects = re.sub(r'{(\w+):?(\w+)?}', replacer, templates.get("effects", ""))
+    reagents = re.sub(r'{(\w+):?(\w+)?}', replacer, templates.reagents)
+    effects = re.sub(r'{(\w+):?(\w+)?}', replacer, templates.effects)
 
-    procedure_steps = templates.get("procedure", [])
+    procedure_steps = templates.procedure
     formatted_steps = []
     
-    if isinstance(procedure_steps, list):
+    if isinstance(procedure_steps, tuple):
         for i, step in enumerate(procedure_steps, 1):
             processed_step = re.sub(r'{(\w+):?(\w+)?}', replacer, step)
             formatted_steps.append(f"👨‍🍳 Шаг {i}: {processed_step}")
@@ -246,7 +250,7 @@ def assemble_recipe(recipe_template: Dict) -> Dict[str, Any]:
 
     return {"text": final_text, "found_terms": found_terms}
 
-def find_recipe_by_intention(query: str) -> dict | None:
+def find_recipe_by_intention(query: str) -> Recipe | None:
     """
     Ищет рецепт по прямому совпадению в 'intention_aliases'.
     Возвращает полный объект рецепта или None, если ничего не найдено.
@@ -258,8 +262,8 @@ def find_recipe_by_intention(query: str) -> dict | None:
     
     for recipe in recipes:
         # Проверяем, есть ли у рецепта вообще ключ intention_aliases
-        if "intention_aliases" in recipe:
-            for alias in recipe["intention_aliases"]:
+        if recipe.intention_aliases:
+            for alias in recipe.intention_aliases:
                 # Если какой-либо из алиасов содержится в запросе пользователя
                 if alias in normalized_query:
                     # Нашли! Возвращаем весь объект рецепта.
@@ -268,36 +272,24 @@ def find_recipe_by_intention(query: str) -> dict | None:
     # Если прошли весь цикл и ничего не нашли
     return None
 
-def find_recipe_by_id(recipe_id: str) -> dict | None:
+def find_recipe_by_id(recipe_id: str) -> Recipe | None:
     """
     Находит рецепт в базе знаний по его уникальному ID.
-    Возвращает словарь с рецептом или None, если ничего не найдено.
+    Возвращает запись Recipe или None, если ничего не найдено.
     """
     recipes_db = KNOWLEDGE_BASE.get("recipes", [])
     for recipe in recipes_db:
-        if recipe.get("id") == recipe_id:
+        if recipe.id == recipe_id:
             return recipe
     return None
     
-def get_all_cuisines() -> List[str]:
-    """Собирает и возвращает уникальный, отсортированный список всех кухонь из базы."""
-    recipes_db = KNOWLEDGE_BASE.get("recipes", [])
-    cuisines = set()
-    for recipe in recipes_db:
-        if "cuisine" in recipe:
-            cuisines.add(recipe["cuisine"])
-    
-    sorted_cuisines = sorted(list(cuisines))
-    logging.info(f"Найдено {len(sorted_cuisines)} уникальных кухонь: {sorted_cuisines}")
-    return sorted_cuisines
-
-def find_random_recipe_by_cuisine(cuisine: str) -> Optional[Dict[str, Any]]:
+def find_random_recipe_by_cuisine(cuisine: str) -> Optional[Recipe]:
     """Находит случайный рецепт по заданной кухне. Аналогично категориям."""
     recipes_db = KNOWLEDGE_BASE.get("recipes", [])
     
     candidates = [
         recipe for recipe in recipes_db 
-        if recipe.get("cuisine") == cuisine
+        if recipe.cuisine == cuisine
     ]
     
     if not candidates:
@@ -305,7 +297,7 @@ def find_random_recipe_by_cuisine(cuisine: str) -> Optional[Dict[str, Any]]:
         return None
     
     chosen_recipe = random.choice(candidates)
-    logging.info(f"По кухне '{cuisine}' был случайно выбран рецепт '{chosen_recipe.get('id')}'.")
+    logging.info(f"По кухне '{cuisine}' был случайно выбран рецепт '{chosen_recipe.id}'.")
     
     return chosen_recipe    
 
@@ -343,7 +335,7 @@ def synthesize_response(user_query: str) -> Dict[str, Any]:
             for key in p_info["excess_keys"]:
                 excess_names.append(ingredients_db.get(key, {}).get("name_forms", {}).get("acc_sg", key))
 
-            option_line = f"{i+1}. {recipe.get('title', 'Безымянный Протокол')} (есть: {p_info['match_count']}/{len(recipe.get('trigger_keys', []))}"
+            option_line = f"{i+1}. {recipe.title or 'Безымянный Протокол'} (есть: {p_info['match_count']}/{len(recipe.trigger_keys)}"
             if missing_names:
                 option_line += f", не хватает: {', '.join(missing_names)}"
             if excess_names: # Вывод лишних ингредиентов, если они есть
@@ -351,7 +343,7 @@ def synthesize_response(user_query: str) -> Dict[str, Any]:
             option_line += ")"
             options_text_lines.append(option_line)
             
-            builder.add(InlineKeyboardButton(text=f"Выбрать {i+1}", callback_data=f"show_recipe_{recipe.get('id')}"))
+            builder.add(InlineKeyboardButton(text=f"Выбрать {i+1}", callback_data=encode_callback("recipe", recipe.id)))
         
         builder.adjust(3) # Выравниваем кнопки по 3 в ряд
 
@@ -365,4 +357,28 @@ def synthesize_response(user_query: str) -> Dict[str, Any]:
         return {
             "text": phrases.get("rejection_phrases", {}).get("no_recipe_found", "Моя извращенная фантазия не может придумать ничего путного из этого набора. Попробуй другую комбинацию или добавь что-то еще."),
             "found_terms": []
-        }
\ No newline at end of file
+        }
+
+def resolve_free_text_query(user_query: str, category_aliases: Dict[str, List[str]]) -> Dict[str, Any]:
+    """
+    Полный конвейер обработки ручного запроса: намерение -> категория -> синтез по ингредиентам.
+    Не трогает ничего, кроме базы знаний, поэтому может выполняться в пуле потоков или процессов.
+    Возвращает словарь с ключом "kind": "recipe", "empty_category" или "synthesized".
+    """
+    intended_recipe = find_recipe_by_intention(user_query)
+    if intended_recipe:
+        return {"kind": "recipe", "recipe": intended_recipe, "response": assemble_recipe(intended_recipe)}
+
+    found_category = None
+    for category_key, aliases in category_aliases.items():
+        if user_query in aliases:
+            found_category = category_key
+            break
+
+    if found_category:
+        random_recipe = find_random_recipe_by_category(found_category)
+        if random_recipe:
+            return {"kind": "recipe", "recipe": random_recipe, "response": assemble_recipe(random_recipe)}
+        return {"kind": "empty_category", "category": found_category}
+
+    return {"kind": "synthesized", "response": synthesize_response(user_query)}
@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, Optional
+
+from utils.recipe_synthesizer import KNOWLEDGE_BASE, load_knowledge_base
+
+EXECUTION_MODES = ("inline", "thread", "process")
+LOOP_LAG_PROBE_INTERVAL = 0.5
+
+
+def percentile_ms(values: Iterable[float], q: float) -> float:
+    """q-перцентиль выборки в секундах, переведенный в миллисекунды."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 2)
+
+
+class SynthesisOverloaded(Exception):
+    """Очередь синтезатора переполнена — запрос отклонен, не дожидаясь исполнения."""
+
+
+def _init_worker():
+    """Инициализатор процесса-воркера: загружает базу знаний один раз на процесс."""
+    load_knowledge_base()
+
+
+def _warmup_worker() -> int:
+    """Пустая задача для прогрева: заставляет пул поднять процесс и вернуть размер базы."""
+    time.sleep(0.05)
+    return len(KNOWLEDGE_BASE.get("recipes", []))
+
+
+class SynthesisExecutor:
+    """
+    Исполняет CPU-тяжелый конвейер синтезатора вне event loop.
+    Режимы: 'inline' (прямо в цикле событий), 'thread' (пул потоков), 'process' (пул процессов).
+    Число одновременно ожидающих вызовов ограничено max_queue, каждый вызов — timeout секундами.
+    Заодно меряет лаг event loop: по нему видно, не тормозят ли кнопки, пока считается синтез.
+
+    Режим 'thread' не изолирует CPU-тяжелый синтез: чистый Python в потоке пула держит GIL
+    наравне с циклом событий, и под нагрузкой кнопки ждут (в нагрузочном прогоне лаг цикла
+    доходил до ~110 мс по p50). Он годится, пока конвейер короткий; если синтез тяжелеет —
+    нужен 'process'.
+
+    Перцентили в get_stats() считаются по последним stats_window замерам каждого вида
+    (None — без ограничения, для коротких прогонов). Раз в stats_every успешных вызовов
+    статистика пишется в лог; на сами замеры это не влияет.
+    """
+
+    def __init__(self, mode: str = "thread", workers: int = 2, max_queue: int = 32,
+                 timeout: float = 10.0, stats_every: int = 100, stats_window: Optional[int] = 1000):
+        if mode not in EXECUTION_MODES:
+            raise ValueError(f"Неизвестный режим исполнения синтезатора: '{mode}'. Допустимы: {EXECUTION_MODES}")
+        self.mode = mode
+        self.workers = max(1, workers)
+        self.max_queue = max(1, max_queue)
+        self.timeout = timeout
+        self.stats_every = stats_every
+        self._pool: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pending = 0
+        self._queue_waits: Deque[float] = deque(maxlen=stats_window)
+        self._run_times: Deque[float] = deque(maxlen=stats_window)
+        self._loop_lags: Deque[float] = deque(maxlen=stats_window)
+        self._lag_probe: Optional[asyncio.Task] = None
+        self._completed = 0
+        self._timeouts = 0
+        self._rejected = 0
+
+    @classmethod
+    def from_env(cls, **overrides: Any) -> "SynthesisExecutor":
+        """Собирает исполнитель из переменных окружения SYNTHESIS_*. overrides — прочие аргументы конструктора."""
+        return cls(
+            mode=os.getenv("SYNTHESIS_MODE", "thread").lower(),
+            workers=int(os.getenv("SYNTHESIS_WORKERS", "2")),
+            max_queue=int(os.getenv("SYNTHESIS_QUEUE_SIZE", "32")),
+            timeout=float(os.getenv("SYNTHESIS_TIMEOUT", "10")),
+            **overrides,
+        )
+
+    async def start(self):
+        """Поднимает пул. В режиме 'process' дожидается, пока каждый воркер загрузит базу знаний."""
+        self._slots = asyncio.Semaphore(self.workers)
+        if self.mode == "thread":
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="synthesizer")
+        elif self.mode == "process":
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+            loop = asyncio.get_running_loop()
+            sizes = await asyncio.gather(*(loop.run_in_executor(self._pool, _warmup_worker) for _ in range(self.workers)))
+            logging.info(f"Пул синтезатора прогрет: {self.workers} процессов, рецептов в каждом: {sizes[0]}.")
+        self._lag_probe = asyncio.create_task(self._probe_loop_lag())
+        logging.info(f"Синтезатор запущен в режиме '{self.mode}' (воркеров: {self.workers}, очередь: {self.max_queue}, таймаут: {self.timeout}с).")
+
+    def shutdown(self):
+        if self._lag_probe is not None:
+            self._lag_probe.cancel()
+            self._lag_probe = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Выполняет func(*args) согласно режиму. Таймаут считается от постановки в очередь.
+        Бросает SynthesisOverloaded при переполненной очереди и asyncio.TimeoutError по таймауту.
+        """
+        if self._slots is None:
+            raise RuntimeError("SynthesisExecutor не запущен: вызови start() до первого run().")
+        if self._pending >= self.max_queue:
+            self._rejected += 1
+            raise SynthesisOverloaded(f"В очереди синтезатора уже {self._pending} запросов.")
+        self._pending += 1
+        try:
+            return await asyncio.wait_for(self._run(func, args, time.perf_counter()), self.timeout)
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            raise
+        finally:
+            self._pending -= 1
+
+    async def _run(self, func: Callable[..., Any], args: tuple, enqueued_at: float) -> Any:
+        await self._slots.acquire()
+        started_at = time.perf_counter()
+        self._queue_waits.append(started_at - enqueued_at)
+
+        if self._pool is None:
+            try:
+                result = func(*args)
+            finally:
+                self._slots.release()
+            self._record_run(started_at)
+            return result
+
+        # Слот освобождается только когда воркер действительно закончил, даже если
+        # вызывающий уже отвалился по таймауту — иначе очередь перестает быть ограниченной.
+        loop = asyncio.get_running_loop()
+        future = self._pool.submit(func, *args)
+        future.add_done_callback(lambda _: self._release_slot(loop))
+        result = await asyncio.wrap_future(future)
+        # Сюда доходят только успешные вызовы: отмененные по таймауту учитываются в _timeouts.
+        self._record_run(started_at)
+        return result
+
+    def _release_slot(self, loop: asyncio.AbstractEventLoop):
+        """Вызывается из потока пула. После shutdown(wait=False) цикл событий может быть уже закрыт."""
+        if loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._slots.release)
+        except RuntimeError:
+            pass
+
+    async def _probe_loop_lag(self):
+        """Раз в LOOP_LAG_PROBE_INTERVAL секунд меряет, насколько позже положенного проснулся цикл."""
+        while True:
+            expected = time.perf_counter() + LOOP_LAG_PROBE_INTERVAL
+            await asyncio.sleep(LOOP_LAG_PROBE_INTERVAL)
+            self._loop_lags.append(max(0.0, time.perf_counter() - expected))
+
+    def _record_run(self, started_at: float):
+        self._run_times.append(time.perf_counter() - started_at)
+        self._completed += 1
+        if self.stats_every and self._completed % self.stats_every == 0:
+            logging.info(f"Статистика синтезатора: {self.get_stats()}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Перцентили ожидания в очереди, времени исполнения и лага event loop (мс) по последним stats_window замерам."""
+        return {
+            "mode": self.mode,
+            "pending": self._pending,
+            "completed": self._completed,
+            "timeouts": self._timeouts,
+            "rejected": self._rejected,
+            "queue_wait_p50_ms": percentile_ms(self._queue_waits, 0.5),
+            "queue_wait_p95_ms": percentile_ms(self._queue_waits, 0.95),
+            "run_p50_ms": percentile_ms(self._run_times, 0.5),
+            "run_p95_ms": percentile_ms(self._run_times, 0.95),
+            "loop_lag_p50_ms": percentile_ms(self._loop_lags, 0.5),
+            "loop_lag_p95_ms": percentile_ms(self._loop_lags, 0.95),
+            "loop_lag_max_ms": round(max(self._loop_lags, default=0.0) * 1000, 2),
+        }